@@ -27,6 +27,7 @@ Module.register("MMM-BlinkCamera", {
         doorbellSound: "doorbell.mp3",       // Sound file to play
         doorbellDuration: 15000,             // How long to show doorbell popup (15s)
         doorbellVolume: 0.8,                 // Volume 0-1
+        topologyCacheTtl: 24 * 60 * 60 * 1000, // Rediscover cameras/networks after 24 hours
         alignment: "left",                   // Alignment: left, center, right
     },
 
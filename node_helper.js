@@ -127,7 +127,8 @@ module.exports = NodeHelper.create({
             email: this.config.email,
             password: this.config.password,
             device_id: "MagicMirror-BlinkCamera",
-            doorbell_poll_interval: Math.max(3, Math.floor((this.config.motionCheckInterval || 30000) / 1000))
+            doorbell_poll_interval: Math.max(3, Math.floor((this.config.motionCheckInterval || 30000) / 1000)),
+            topology_cache_ttl: Math.max(0, Math.floor((this.config.topologyCacheTtl || 86400000) / 1000))
         };
         fs.writeFileSync(configPath, JSON.stringify(config, null, 2));
     },
@@ -0,0 +1,140 @@
+"""
+Blink Topology Cache for MMM-BlinkCamera
+Caches discovered networks, sync modules and cameras so routine runs skip full discovery
+"""
+
+import json
+import os
+import sys
+import time
+
+from blinkpy.auth import BlinkTwoFARequiredError, LoginError, TokenRefreshFailed
+from blinkpy.blinkpy import BlinkSetupError
+
+CACHE_VERSION = 1
+DEFAULT_TTL = 86400  # seconds
+
+
+def _device_ids(homescreen):
+    """Fingerprint of every device listed on the homescreen"""
+    ids = []
+    for kind in ("networks", "sync_modules", "cameras", "owls", "doorbells"):
+        for device in (homescreen or {}).get(kind) or []:
+            ids.append(f"{kind}:{device.get('id')}:{device.get('name')}")
+    return sorted(ids)
+
+
+def load_topology(cache_file, blink, account_id, ttl):
+    """Return cached topology, or None if missing, invalid, expired or from another version/account"""
+    try:
+        cache = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cache, dict):
+        return None
+    if cache.get("version") != CACHE_VERSION or cache.get("blinkpy") != blink.version:
+        return None
+    if cache.get("account_id") != account_id:
+        return None
+    if not isinstance(cache.get("networks"), dict) or not isinstance(cache.get("cameras"), dict):
+        return None
+    if not isinstance(cache.get("devices"), list):
+        return None
+
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)):
+        ttl = DEFAULT_TTL
+    saved_at = cache.get("saved_at")
+    if not isinstance(saved_at, (int, float)) or time.time() - saved_at > ttl:
+        return None
+    return cache
+
+
+def save_topology(cache_file, blink, account_id):
+    """Store the topology found by a full discovery"""
+    cameras = {}
+    for network_id, status in blink.networks.items():
+        sync = blink.sync.get(status["name"])
+        if status["onboarded"] and sync is not None:
+            cameras[network_id] = sync.camera_list
+
+    cache = {
+        "version": CACHE_VERSION,
+        "blinkpy": blink.version,
+        "account_id": account_id,
+        "saved_at": time.time(),
+        "networks": blink.networks,
+        "cameras": cameras,
+        "devices": _device_ids(blink.homescreen),
+    }
+
+    # fetch and doorbell may write at the same time
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(json.dumps(cache))
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        sys.stderr.write(f"Topology cache write error: {e}\n")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+async def _hydrate(blink, cache):
+    """Rebuild sync modules from cache; replaces only the networks and camera list requests"""
+    blink.networks = cache["networks"]
+    networks = blink.setup_network_ids()
+    await blink.setup_owls()
+    await blink.setup_lotus()
+
+    # An offline sync module is not a topology change, same as setup_post_verify()
+    for name, network_id in networks.items():
+        await blink.setup_sync_module(name, network_id, cache["cameras"].get(network_id, []))
+
+    blink.cameras = blink.merge_cameras()
+    blink.available = True
+    return True
+
+
+async def start_blink(blink, cache_file, account_id, ttl=DEFAULT_TTL):
+    """Start blink from the topology cache, falling back to full discovery"""
+    cache = load_topology(cache_file, blink, account_id, ttl)
+    if not cache:
+        started = await blink.start()
+        if blink.available:
+            save_topology(cache_file, blink, account_id)
+        return started
+
+    try:
+        # Same auth and homescreen steps as blink.start()
+        await blink.auth.startup()
+        blink.setup_urls()
+        await blink.get_homescreen()
+    except (LoginError, TokenRefreshFailed, BlinkSetupError):
+        blink.available = False
+        return False
+    except BlinkTwoFARequiredError:
+        raise
+    except Exception as e:
+        sys.stderr.write(f"Topology cache error: {e}\n")
+        return await blink.start()
+
+    if not blink.last_refresh:
+        blink.last_refresh = int(time.time() - blink.refresh_rate * 1.05)
+
+    # Devices added, removed or renamed since the cache was written
+    if _device_ids(blink.homescreen) == cache["devices"]:
+        try:
+            if await _hydrate(blink, cache):
+                return True
+        except Exception as e:
+            sys.stderr.write(f"Topology cache error: {e}\n")
+
+    # Rediscover, reusing the homescreen fetched above
+    blink.networks = []
+    blink.sync.clear()
+    started = await blink.setup_post_verify()
+    if blink.available:
+        save_topology(cache_file, blink, account_id)
+    return started
@@ -15,6 +15,7 @@ async def main():
         from aiohttp import ClientSession
         from blinkpy.blinkpy import Blink
         from blinkpy.auth import Auth
+        from blink_cache import start_blink, DEFAULT_TTL
     except ImportError as e:
         print(json.dumps({"event": "error", "error": str(e)}))
         sys.stdout.flush()
@@ -23,6 +24,7 @@ async def main():
     script_dir = Path(__file__).parent
     config_file = script_dir / "config.json"
     creds_file = script_dir / "credentials.json"
+    cache_file = script_dir / ".topology_cache"
     images_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir / "images"
     images_dir.mkdir(parents=True, exist_ok=True)
 
@@ -57,7 +59,8 @@ async def main():
         blink.auth = auth
 
         try:
-            await blink.start()
+            ttl = config.get("topology_cache_ttl", DEFAULT_TTL)
+            await start_blink(blink, cache_file, creds.get("account_id"), ttl)
             
             # Send startup event
             print(json.dumps({"event": "started", "cameras": list(blink.cameras.keys())}))
@@ -15,6 +15,7 @@ async def main():
         from aiohttp import ClientSession
         from blinkpy.blinkpy import Blink
         from blinkpy.auth import Auth
+        from blink_cache import start_blink, DEFAULT_TTL
     except ImportError as e:
         print(json.dumps({"success": False, "error": str(e)}))
         return
@@ -22,6 +23,7 @@ async def main():
     script_dir = Path(__file__).parent
     config_file = script_dir / "config.json"
     creds_file = script_dir / "credentials.json"
+    cache_file = script_dir / ".topology_cache"
     
     # Get images directory from args or use default
     images_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir / "images"
@@ -63,8 +65,9 @@ async def main():
         blink.auth = auth
 
         try:
-            # Use start() - it should use the existing token if valid
-            await blink.start()
+            # Hydrate from the topology cache; full start() only on expiry or mismatch
+            ttl = config.get("topology_cache_ttl", DEFAULT_TTL)
+            await start_blink(blink, cache_file, creds.get("account_id"), ttl)
             
             cameras_data = {}
             
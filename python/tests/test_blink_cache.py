@@ -0,0 +1,237 @@
+"""
+Tests for blink_cache using a stub Blink that mirrors blinkpy's setup sequence
+"""
+
+import asyncio
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    from blinkpy.auth import BlinkTwoFARequiredError, LoginError
+except ImportError:
+    # Only blinkpy's exception classes are needed; the Blink object itself is stubbed
+    class LoginError(Exception):
+        pass
+
+    class BlinkTwoFARequiredError(Exception):
+        pass
+
+    auth_module = types.ModuleType("blinkpy.auth")
+    auth_module.LoginError = LoginError
+    auth_module.TokenRefreshFailed = type("TokenRefreshFailed", (Exception,), {})
+    auth_module.BlinkTwoFARequiredError = BlinkTwoFARequiredError
+    blinkpy_module = types.ModuleType("blinkpy.blinkpy")
+    blinkpy_module.BlinkSetupError = type("BlinkSetupError", (Exception,), {})
+    sys.modules["blinkpy"] = types.ModuleType("blinkpy")
+    sys.modules["blinkpy.auth"] = auth_module
+    sys.modules["blinkpy.blinkpy"] = blinkpy_module
+
+import blink_cache
+
+HOMESCREEN = {
+    "networks": [{"id": 10, "name": "Home"}],
+    "sync_modules": [{"id": 20, "name": "Home"}],
+    "cameras": [{"id": 1, "name": "Front"}],
+}
+NETWORKS = {"10": {"name": "Home", "onboarded": True}}
+CAMERAS = {"10": [{"name": "Front", "id": 1, "type": "default"}]}
+
+
+class StubAuth:
+    def __init__(self, calls, error=None):
+        self.calls = calls
+        self.error = error
+
+    async def startup(self):
+        self.calls.append("startup")
+        if self.error:
+            raise self.error
+
+
+class StubSync:
+    def __init__(self, name, network_id, camera_list, available=True):
+        self.name = name
+        self.camera_list = camera_list
+        self.available = available
+
+
+class StubBlink:
+    version = "0.25.0"
+
+    def __init__(self, homescreen=HOMESCREEN, auth_error=None, sync_available=True):
+        self.calls = []
+        self.auth = StubAuth(self.calls, auth_error)
+        self.sync_available = sync_available
+        self.server_homescreen = homescreen
+        self.homescreen = {}
+        self.networks = []
+        self.network_ids = []
+        self.sync = {}
+        self.cameras = {}
+        self.available = False
+        self.last_refresh = None
+        self.refresh_rate = 30
+
+    async def start(self):
+        self.calls.append("start")
+        try:
+            await self.auth.startup()
+            self.setup_urls()
+            await self.get_homescreen()
+        except LoginError:
+            self.available = False
+            return False
+        return await self.setup_post_verify()
+
+    async def setup_post_verify(self):
+        if not self.homescreen:
+            await self.get_homescreen()
+        await self.setup_networks()
+        networks = self.setup_network_ids()
+        cameras = await self.setup_camera_list()
+        for name, network_id in networks.items():
+            await self.setup_sync_module(name, network_id, cameras.get(network_id, []))
+        self.cameras = self.merge_cameras()
+        self.available = True
+        return True
+
+    def setup_urls(self):
+        pass
+
+    async def get_homescreen(self):
+        self.calls.append("homescreen")
+        self.homescreen = self.server_homescreen
+
+    async def setup_networks(self):
+        self.calls.append("networks")
+        self.networks = NETWORKS
+
+    def setup_network_ids(self):
+        network_dict = {s["name"]: n for n, s in self.networks.items() if s["onboarded"]}
+        self.network_ids = list(network_dict.values())
+        return network_dict
+
+    async def setup_camera_list(self):
+        self.calls.append("camera_list")
+        return CAMERAS
+
+    async def setup_owls(self):
+        return []
+
+    async def setup_lotus(self):
+        return []
+
+    async def setup_sync_module(self, name, network_id, cameras):
+        self.calls.append("sync")
+        self.sync[name] = StubSync(name, network_id, cameras, self.sync_available)
+
+    def merge_cameras(self):
+        return {c["name"]: c for sync in self.sync.values() for c in sync.camera_list}
+
+
+def run(blink, cache_file, account_id="acct", ttl=blink_cache.DEFAULT_TTL):
+    return asyncio.run(blink_cache.start_blink(blink, cache_file, account_id, ttl))
+
+
+def warm(cache_file):
+    run(StubBlink(), cache_file)
+    assert cache_file.exists()
+
+
+def test_cache_hit_skips_discovery(tmp_path):
+    cache_file = tmp_path / ".topology_cache"
+    warm(cache_file)
+
+    blink = StubBlink()
+    assert run(blink, cache_file)
+    assert blink.calls == ["startup", "homescreen", "sync"]
+    assert list(blink.cameras) == ["Front"]
+    assert blink.available
+
+
+def test_cache_miss_runs_full_start(tmp_path):
+    cache_file = tmp_path / ".topology_cache"
+    warm(cache_file)
+
+    expired = StubBlink()
+    run(expired, cache_file, ttl=-1)
+    assert "start" in expired.calls and "networks" in expired.calls
+
+    other_account = StubBlink()
+    run(other_account, cache_file, account_id="other")
+    assert "start" in other_account.calls and "camera_list" in other_account.calls
+
+    cache = json.loads(cache_file.read_text())
+    cache["blinkpy"] = "0.0.1"
+    cache_file.write_text(json.dumps(cache))
+    other_version = StubBlink()
+    run(other_version, cache_file, account_id="other")
+    assert "start" in other_version.calls
+
+
+def test_fingerprint_mismatch_fetches_homescreen_once(tmp_path):
+    cache_file = tmp_path / ".topology_cache"
+    warm(cache_file)
+
+    renamed = dict(HOMESCREEN, cameras=[{"id": 1, "name": "Porch"}])
+    blink = StubBlink(homescreen=renamed)
+    assert run(blink, cache_file)
+    assert blink.calls.count("homescreen") == 1
+    assert blink.calls.count("startup") == 1
+    assert "start" not in blink.calls
+    assert "networks" in blink.calls and "camera_list" in blink.calls
+
+    cache = json.loads(cache_file.read_text())
+    assert "cameras:1:Porch" in cache["devices"]
+
+
+def test_invalid_cache_is_a_miss(tmp_path):
+    cache_file = tmp_path / ".topology_cache"
+    for content in ("[]", "null", "{not json", json.dumps({"saved_at": "x"})):
+        cache_file.write_text(content)
+        blink = StubBlink()
+        assert run(blink, cache_file)
+        assert "start" in blink.calls
+
+
+def test_offline_sync_module_does_not_rediscover(tmp_path):
+    cache_file = tmp_path / ".topology_cache"
+    warm(cache_file)
+
+    blink = StubBlink(sync_available=False)
+    assert run(blink, cache_file)
+    assert "networks" not in blink.calls
+    assert "camera_list" not in blink.calls
+    assert blink.calls.count("sync") == 1
+    assert list(blink.cameras) == ["Front"]
+
+
+def test_auth_error_does_not_retry_login(tmp_path):
+    cache_file = tmp_path / ".topology_cache"
+    warm(cache_file)
+
+    blink = StubBlink(auth_error=LoginError("bad token"))
+    assert run(blink, cache_file) is False
+    assert blink.calls == ["startup"]
+    assert not blink.available
+
+    blink = StubBlink(auth_error=BlinkTwoFARequiredError())
+    with pytest.raises(BlinkTwoFARequiredError):
+        run(blink, cache_file)
+    assert blink.calls == ["startup"]
+
+
+def test_invalid_ttl_uses_default(tmp_path):
+    cache_file = tmp_path / ".topology_cache"
+    warm(cache_file)
+
+    for ttl in ("3600", None, True):
+        blink = StubBlink()
+        assert run(blink, cache_file, ttl=ttl)
+        assert "start" not in blink.calls